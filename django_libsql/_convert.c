@@ -0,0 +1,89 @@
+/*
+ * Optional C accelerator for the "format" -> "qmark" query conversion.
+ *
+ * convert_format(query) is equivalent to the pure-Python fallback in
+ * django_libsql/db/backends/sqlite3/base.py: "%s" (not preceded by "%")
+ * becomes "?", "%%" becomes "%", everything else is copied through in a
+ * single pass. The build is optional; the backend falls back to the
+ * Python implementation when this module is unavailable.
+ */
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+static PyObject *
+convert_format(PyObject *self, PyObject *arg)
+{
+    Py_ssize_t n, i, j;
+    int kind, okind;
+    const void *data;
+    void *odata;
+    Py_UCS4 maxchar;
+    PyObject *out, *result;
+
+    if (!PyUnicode_Check(arg)) {
+        PyErr_SetString(PyExc_TypeError, "convert_format() expects a str");
+        return NULL;
+    }
+    if (PyUnicode_READY(arg) < 0)
+        return NULL;
+
+    n = PyUnicode_GET_LENGTH(arg);
+    kind = PyUnicode_KIND(arg);
+    data = PyUnicode_DATA(arg);
+
+    /* The output is never longer than the input: both rewrites shrink. */
+    maxchar = n ? PyUnicode_MAX_CHAR_VALUE(arg) : 127;
+    out = PyUnicode_New(n, maxchar);
+    if (out == NULL)
+        return NULL;
+    okind = PyUnicode_KIND(out);
+    odata = PyUnicode_DATA(out);
+
+    j = 0;
+    for (i = 0; i < n; ) {
+        Py_UCS4 ch = PyUnicode_READ(kind, data, i);
+        if (ch == '%' && i + 1 < n) {
+            Py_UCS4 nxt = PyUnicode_READ(kind, data, i + 1);
+            if (nxt == '%') {
+                /* "%%" escape: keep one "%" and skip the pair */
+                PyUnicode_WRITE(okind, odata, j++, '%');
+                i += 2;
+                continue;
+            }
+            if (nxt == 's' &&
+                (i == 0 || PyUnicode_READ(kind, data, i - 1) != '%')) {
+                PyUnicode_WRITE(okind, odata, j++, '?');
+                i += 2;
+                continue;
+            }
+        }
+        PyUnicode_WRITE(okind, odata, j++, ch);
+        i++;
+    }
+
+    if (j == n)
+        return out;
+    result = PyUnicode_Substring(out, 0, j);
+    Py_DECREF(out);
+    return result;
+}
+
+static PyMethodDef convert_methods[] = {
+    {"convert_format", convert_format, METH_O,
+     "Convert \"format\" style placeholders to \"qmark\" style."},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef convert_module = {
+    PyModuleDef_HEAD_INIT,
+    "django_libsql._convert",
+    "C accelerator for query placeholder conversion.",
+    -1,
+    convert_methods
+};
+
+PyMODINIT_FUNC
+PyInit__convert(void)
+{
+    return PyModule_Create(&convert_module);
+}
@@ -3,10 +3,15 @@ libSQL backend for Django using the new python-libsql package.
 """
 import datetime
 import decimal
+import functools
+import queue
+import re
 import sys
+import time
 import warnings
+from collections import OrderedDict, namedtuple
 from collections.abc import Mapping
-from itertools import chain, tee
+from itertools import chain
 from typing import Optional, Dict, Any
 from urllib.parse import urlparse, parse_qs
 
@@ -18,7 +23,20 @@ from django.db import IntegrityError
 from django.db.backends.base.base import BaseDatabaseWrapper
 from django.utils.asyncio import async_unsafe
 from django.utils.dateparse import parse_date, parse_datetime, parse_time
-from django.utils.regex_helper import _lazy_re_compile
+# These regexes sit on the per-execute hot path, so compile them eagerly at
+# import time: _lazy_re_compile's wrapper adds an attribute-dispatch per use.
+_DML_RE = re.compile(r"^\s*(?:INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+# Matches a plain single-row INSERT/REPLACE whose VALUES clause is entirely
+# qmark placeholders, so it can be rewritten into a multi-row insert.
+_INSERT_VALUES_RE = re.compile(
+    r"^(?P<head>\s*(?:INSERT|REPLACE)\b[^;]*?\bVALUES\s*)"
+    r"\((?P<placeholders>\s*\?\s*(?:,\s*\?\s*)*)\)\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# SQLITE_MAX_VARIABLE_NUMBER; bound the number of rows per rewritten INSERT
+_SQLITE_MAX_VARIABLE_NUMBER = 999
 
 
 def decoder(conv_func):
@@ -43,38 +61,68 @@ def adapt_decimal_to_str(val):
     return str(val)
 
 
+# The converters below run once per matched column per row. libsql returns
+# str in most configurations, so the bytes test uses an exact type check
+# (a C-level pointer comparison) rather than isinstance, and the parse_*
+# functions are bound as default arguments to skip the global lookup.
+
 def convert_bool(val):
     """Convert database value to Python bool."""
-    if isinstance(val, bytes):
+    if val is None:
+        return None
+    if type(val) is bytes:
         return val == b'1'
-    return bool(val) if val is not None else None
+    return bool(val)
 
 
-def convert_date(val):
+def convert_date(val, _parse_date=parse_date):
     """Convert database value to Python date."""
     if val is None:
         return None
-    if isinstance(val, bytes):
-        val = val.decode()
-    return parse_date(val)
+    return _parse_date(val.decode() if type(val) is bytes else val)
 
 
-def convert_datetime(val):
+def convert_datetime(val, _parse_datetime=parse_datetime):
     """Convert database value to Python datetime."""
     if val is None:
         return None
-    if isinstance(val, bytes):
-        val = val.decode()
-    return parse_datetime(val)
+    return _parse_datetime(val.decode() if type(val) is bytes else val)
 
 
-def convert_time(val):
+def convert_time(val, _parse_time=parse_time):
     """Convert database value to Python time."""
     if val is None:
         return None
-    if isinstance(val, bytes):
-        val = val.decode()
-    return parse_time(val)
+    return _parse_time(val.decode() if type(val) is bytes else val)
+
+
+# Registered parameter adapters, keyed by type. Kept at module level so the
+# hot path can test emptiness with a single name lookup.
+_ADAPTERS = {}
+
+# Memo of concrete type -> adapter (or None), filled on first sight of each
+# type. Catches subclass instances that a plain `type(param) in _ADAPTERS`
+# lookup would miss, at the cost of one MRO walk per new type.
+_ADAPTER_MEMO = {}
+
+
+def _resolve_adapter(param_type):
+    """Find the adapter for a type by walking its MRO; memoize the result."""
+    adapter = None
+    for base in param_type.__mro__:
+        if base in _ADAPTERS:
+            adapter = _ADAPTERS[base]
+            break
+    _ADAPTER_MEMO[param_type] = adapter
+    return adapter
+
+
+# Pools of warmed connections to remote databases, keyed by connection-param
+# signature. Only populated when OPTIONS["pool_size"] > 0; local file and
+# in-memory connections are never pooled.
+_CONNECTION_POOLS = {}
+
+_REMOTE_URL_PREFIXES = ("http://", "https://", "ws://", "wss://", "libsql://")
 
 
 class LibSQLDatabase:
@@ -105,7 +153,10 @@ class LibSQLDatabase:
     InternalError = DatabaseError
     ProgrammingError = DatabaseError
     NotSupportedError = DatabaseError
-    
+
+    # Registered adapters (shared with the module-level dict)
+    _adapters = _ADAPTERS
+
     @staticmethod
     def connect(**kwargs):
         """Create a libsql connection with Django-compatible parameters."""
@@ -123,9 +174,9 @@ class LibSQLDatabase:
     def register_adapter(type_obj, adapter):
         """Register type adapter (stored for manual application)."""
         # libsql doesn't support global adapters, we'll handle this in cursor
-        if not hasattr(LibSQLDatabase, '_adapters'):
-            LibSQLDatabase._adapters = {}
-        LibSQLDatabase._adapters[type_obj] = adapter
+        _ADAPTERS[type_obj] = adapter
+        # Cached resolutions may be stale now
+        _ADAPTER_MEMO.clear()
 
 
 class LibSQLConnection:
@@ -147,13 +198,20 @@ class LibSQLConnection:
         - check_same_thread: Ignored (for compatibility)
         - uri: Ignored (for compatibility)
         - detect_types: Ignored (we handle types manually)
+        - statement_cache_size: Size of the per-connection statement-info
+          cache (0 disables it)
+        - lazy_decode: Return LibSQLLazyRow instances that convert columns
+          on access instead of eagerly converted tuples
+        - bulk_insert: Rewrite executemany INSERTs into multi-row VALUES
+          statements
         """
-        self.database = kwargs.get('database', ':memory:')
-        self.auth_token = kwargs.get('auth_token', '')
-        self.sync_url = kwargs.get('sync_url', None)
-        self.encryption_key = kwargs.get('encryption_key', None)
-        self.timeout = kwargs.get('timeout', 5.0)
-        self._isolation_level = kwargs.get('isolation_level', '')
+        kwargs_get = kwargs.get
+        self.database = kwargs_get('database', ':memory:')
+        self.auth_token = kwargs_get('auth_token', '')
+        self.sync_url = kwargs_get('sync_url', None)
+        self.encryption_key = kwargs_get('encryption_key', None)
+        self.timeout = kwargs_get('timeout', 5.0)
+        self._isolation_level = kwargs_get('isolation_level', '')
         
         # Parse Turso URL if provided
         if self.database.startswith('libsql://'):
@@ -176,7 +234,7 @@ class LibSQLConnection:
         if self.database == ':memory:' or self.database.startswith('file:'):
             # In-memory or local file database
             conn_params['database'] = self.database
-        elif self.database.startswith(('http://', 'https://', 'ws://', 'wss://')):
+        elif self.database.startswith(_REMOTE_URL_PREFIXES):
             # Remote database
             conn_params['database'] = self.database
             if self.auth_token:
@@ -199,7 +257,7 @@ class LibSQLConnection:
         if '_turso_url' in kwargs:
             turso_url = kwargs['_turso_url']
             # Check if we should use direct remote connection or embedded replica
-            if kwargs.get('_turso_mode', 'remote') == 'remote':
+            if kwargs_get('_turso_mode', 'remote') == 'remote':
                 # Direct remote connection (no local caching)
                 # Clear any existing database/sync_url settings to ensure remote-only
                 conn_params.clear()
@@ -216,7 +274,7 @@ class LibSQLConnection:
                     conn_params['auth_token'] = kwargs['_turso_auth_token']
             else:
                 # Use embedded replica mode with local file (for offline support)
-                conn_params['database'] = kwargs.get('local_file', 'local.db')
+                conn_params['database'] = kwargs_get('local_file', 'local.db')
                 conn_params['sync_url'] = turso_url
                 if '_turso_auth_token' in kwargs:
                     conn_params['auth_token'] = kwargs['_turso_auth_token']
@@ -235,7 +293,24 @@ class LibSQLConnection:
         
         # Track transaction state
         self._in_transaction = False
-        
+
+        # Per-connection LRU cache of per-statement info keyed by SQL text.
+        # libsql exposes no prepare() API, so we can't hold prepared
+        # statement handles here; instead we cache what this wrapper would
+        # otherwise recompute for every execute of the same statement.
+        self.statement_cache_size = kwargs_get('statement_cache_size', 128)
+        self._stmt_cache = OrderedDict() if self.statement_cache_size > 0 else None
+
+        # Opt-in lazy row decoding (see LibSQLLazyRow)
+        self.lazy_decode = kwargs_get('lazy_decode', False)
+
+        # Opt-in multi-row INSERT rewriting in executemany
+        self.bulk_insert = kwargs_get('bulk_insert', False)
+
+        # Shared cursor for connection-level execute()/executemany(); created
+        # lazily and reused so those shortcuts stop leaking a wrapper per call.
+        self._default_cursor = None
+
     @property
     def isolation_level(self):
         """Get current isolation level."""
@@ -284,12 +359,16 @@ class LibSQLConnection:
     
     def execute(self, sql, params=None):
         """Execute SQL directly on connection."""
-        cursor = self.cursor()
+        cursor = self._default_cursor
+        if cursor is None:
+            cursor = self._default_cursor = self.cursor()
         return cursor.execute(sql, params)
-    
+
     def executemany(self, sql, params_list):
         """Execute SQL with multiple parameter sets."""
-        cursor = self.cursor()
+        cursor = self._default_cursor
+        if cursor is None:
+            cursor = self._default_cursor = self.cursor()
         return cursor.executemany(sql, params_list)
     
     def executescript(self, sql_script):
@@ -309,11 +388,57 @@ class LibSQLConnection:
         return False
 
 
+class LibSQLLazyRow:
+    """
+    Row wrapper that defers converter application until a column is read.
+
+    Useful for wide result sets where callers only consume a few columns;
+    enabled via OPTIONS["lazy_decode"].
+    """
+
+    __slots__ = ('_row', '_converters', '_cache')
+
+    def __init__(self, row, converters):
+        self._row = row
+        self._converters = converters
+        self._cache = {}
+
+    def __getitem__(self, index):
+        cache = self._cache
+        if index in cache:
+            return cache[index]
+        value = self._row[index]
+        converter = self._converters[index]
+        if converter is not None and value is not None:
+            try:
+                value = converter(value)
+            except:
+                pass
+        cache[index] = value
+        return value
+
+    def __len__(self):
+        return len(self._row)
+
+    def __iter__(self):
+        for index in range(len(self._row)):
+            yield self[index]
+
+
 class LibSQLCursor:
     """
     Cursor wrapper that provides sqlite3-compatible interface for libsql cursors.
     """
-    
+
+    # Cursors are created and torn down constantly on ORM-heavy workloads;
+    # slots drop the per-instance __dict__ and make every attribute access
+    # in the hot execute/fetch methods a fixed slot load.
+    __slots__ = (
+        'connection', '_cursor', 'lastrowid', 'rowcount', 'description',
+        'arraysize', '_col_converters', '_col_names_lower', '_needs_convert',
+        '_lazy_decode', '_has_lastrowid', '_has_rowcount', '_has_description',
+    )
+
     def __init__(self, connection, base_cursor):
         """Initialize cursor wrapper."""
         self.connection = connection
@@ -322,42 +447,110 @@ class LibSQLCursor:
         self.rowcount = -1
         self.description = None
         self.arraysize = 100
+        self._col_converters = None
+        self._col_names_lower = None
+        self._needs_convert = False
+        self._lazy_decode = getattr(connection, 'lazy_decode', False)
+        # Probe the driver cursor once; libsql always has these attributes
+        # in practice, so per-execute getattr-with-default calls are wasted.
+        self._has_lastrowid = hasattr(base_cursor, 'lastrowid')
+        self._has_rowcount = hasattr(base_cursor, 'rowcount')
+        self._has_description = hasattr(base_cursor, 'description')
     
     def execute(self, sql, params=None):
         """Execute a SQL statement."""
-        # Start transaction if needed - trust libsql's transaction tracking
-        if (self.connection._isolation_level is not None and 
-            not self.connection._connection.in_transaction and
-            self._is_dml(sql)):
+        self._maybe_begin(sql)
+        return self._execute_fast(sql, params)
+
+    def executemany(self, sql, params_list):
+        """Execute SQL with multiple parameter sets."""
+        # The transaction state can't change between iterations, so check
+        # once for the whole batch instead of once per row.
+        self._maybe_begin(sql)
+        if getattr(self.connection, 'bulk_insert', False):
+            match = _INSERT_VALUES_RE.match(sql)
+            if match:
+                params_list = list(params_list)
+                if params_list and isinstance(params_list[0], (list, tuple)):
+                    return self._executemany_bulk(match, params_list)
+        cursor = self._cursor
+        if hasattr(cursor, 'executemany'):
+            # Delegate the whole batch to libsql: one call across the
+            # Python/C boundary instead of one per row.
+            adapt = self._adapt_params
+            cursor.executemany(sql, [adapt(params) for params in params_list])
+            # Update cursor state once for the batch
+            self._sync_state()
+        else:
+            execute_fast = self._execute_fast
+            for params in params_list:
+                execute_fast(sql, params)
+        return self
+
+    def _maybe_begin(self, sql):
+        """Start a transaction if needed - trust libsql's transaction tracking."""
+        connection = self.connection
+        if (connection._isolation_level is not None and
+            not connection._connection.in_transaction and
+            self._is_dml_cached(sql)):
             # Start implicit transaction for DML in non-autocommit mode
             self._cursor.execute("BEGIN")
             # Update our tracking to match libsql's state
-            self.connection._in_transaction = self.connection._connection.in_transaction
-        
+            connection._in_transaction = connection._connection.in_transaction
+
+    def _execute_fast(self, sql, params=None):
+        """Execute without the DML/transaction check (already done by caller)."""
+        cursor = self._cursor
+
         # Apply parameter adapters
         if params:
             params = self._adapt_params(params)
-        
+
         # Execute the query
-        result = self._cursor.execute(sql, params) if params else self._cursor.execute(sql)
-        
+        result = cursor.execute(sql, params) if params else cursor.execute(sql)
+
         # Update cursor state
-        self.lastrowid = getattr(self._cursor, 'lastrowid', None)
-        self.rowcount = getattr(self._cursor, 'rowcount', -1)
-        self.description = getattr(self._cursor, 'description', None)
-        
+        self._sync_state()
+
         return self
-    
-    def executemany(self, sql, params_list):
-        """Execute SQL with multiple parameter sets."""
-        for params in params_list:
-            self.execute(sql, params)
+
+    def _executemany_bulk(self, match, params_list):
+        """
+        Execute an INSERT once per chunk of rows by rewriting the VALUES
+        clause to ``VALUES (?,..),(?,..),...`` - one VDBE program (and, for
+        remote databases, one round-trip) per chunk instead of per row.
+        """
+        cursor = self._cursor
+        adapt = self._adapt_params
+        head = match['head']
+        row_placeholders = "(%s)" % match['placeholders']
+        num_placeholders = row_placeholders.count('?')
+        chunk_size = max(1, _SQLITE_MAX_VARIABLE_NUMBER // num_placeholders)
+
+        for start in range(0, len(params_list), chunk_size):
+            chunk = params_list[start:start + chunk_size]
+            flat_params = []
+            for params in chunk:
+                flat_params.extend(adapt(params))
+            cursor.execute(head + ",".join([row_placeholders] * len(chunk)), flat_params)
+        self._sync_state()
         return self
+
+    def _sync_state(self):
+        """Mirror the driver cursor's state after an execute."""
+        cursor = self._cursor
+        self.lastrowid = cursor.lastrowid if self._has_lastrowid else None
+        self.rowcount = cursor.rowcount if self._has_rowcount else -1
+        self.description = cursor.description if self._has_description else None
+        self._col_converters = self._build_col_converters(self.description)
+        self._needs_convert = self._col_converters is not None
     
     def fetchone(self):
         """Fetch one row from results."""
         row = self._cursor.fetchone()
         if row:
+            if self._lazy_decode and self._needs_convert:
+                return LibSQLLazyRow(row, self._col_converters)
             return self._convert_row(row)
         return row
     
@@ -365,23 +558,27 @@ class LibSQLCursor:
         """Fetch multiple rows from results."""
         if size is None:
             size = self.arraysize
-        rows = []
-        for _ in range(size):
-            row = self.fetchone()
-            if row is None:
-                break
-            rows.append(row)
-        return rows
-    
+        # One driver call for the whole slice; convert afterwards only if
+        # some column actually has a converter.
+        rows = self._cursor.fetchmany(size)
+        if not self._needs_convert:
+            return rows
+        if self._lazy_decode:
+            converters = self._col_converters
+            return [LibSQLLazyRow(row, converters) for row in rows]
+        convert_row = self._convert_row
+        return [convert_row(row) for row in rows]
+
     def fetchall(self):
         """Fetch all remaining rows from results."""
-        rows = []
-        while True:
-            row = self.fetchone()
-            if row is None:
-                break
-            rows.append(row)
-        return rows
+        rows = self._cursor.fetchall()
+        if not self._needs_convert:
+            return rows
+        if self._lazy_decode:
+            converters = self._col_converters
+            return [LibSQLLazyRow(row, converters) for row in rows]
+        convert_row = self._convert_row
+        return [convert_row(row) for row in rows]
     
     def close(self):
         """Close the cursor."""
@@ -401,56 +598,104 @@ class LibSQLCursor:
     
     def _is_dml(self, sql):
         """Check if SQL is a DML statement."""
-        sql_upper = sql.strip().upper()
-        return any(sql_upper.startswith(cmd) for cmd in ('INSERT', 'UPDATE', 'DELETE', 'REPLACE'))
+        return _DML_RE.match(sql) is not None
+
+    def _is_dml_cached(self, sql):
+        """Like _is_dml, but memoized in the connection's statement cache."""
+        connection = self.connection
+        cache = connection._stmt_cache
+        if cache is None:
+            return self._is_dml(sql)
+        try:
+            is_dml = cache[sql]
+            cache.move_to_end(sql)
+        except KeyError:
+            is_dml = cache[sql] = self._is_dml(sql)
+            if len(cache) > connection.statement_cache_size:
+                cache.popitem(last=False)
+        return is_dml
     
     def _adapt_params(self, params):
         """Apply registered adapters to parameters."""
-        if not hasattr(LibSQLDatabase, '_adapters'):
+        if not _ADAPTERS:
             return params
-        
-        adapters = LibSQLDatabase._adapters
-        
+
+        memo = _ADAPTER_MEMO
+
+        # Only allocate a new container if an adapter actually fires; batches
+        # of primitive types are returned unchanged.
         if isinstance(params, (list, tuple)):
-            adapted = []
-            for param in params:
-                param_type = type(param)
-                if param_type in adapters:
-                    param = adapters[param_type](param)
-                adapted.append(param)
+            adapted = None
+            for i, param in enumerate(params):
+                t = type(param)
+                try:
+                    adapter = memo[t]
+                except KeyError:
+                    adapter = _resolve_adapter(t)
+                if adapter is not None:
+                    if adapted is None:
+                        adapted = list(params)
+                    adapted[i] = adapter(param)
+            if adapted is None:
+                return params
             return tuple(adapted) if isinstance(params, tuple) else adapted
         elif isinstance(params, dict):
-            adapted = {}
+            adapted = None
             for key, param in params.items():
-                param_type = type(param)
-                if param_type in adapters:
-                    param = adapters[param_type](param)
-                adapted[key] = param
-            return adapted
+                t = type(param)
+                try:
+                    adapter = memo[t]
+                except KeyError:
+                    adapter = _resolve_adapter(t)
+                if adapter is not None:
+                    if adapted is None:
+                        adapted = dict(params)
+                    adapted[key] = adapter(param)
+            return params if adapted is None else adapted
         else:
             return params
     
+    def _build_col_converters(self, description):
+        """Resolve the converter (or None) for each column of a result set."""
+        if not description or not hasattr(LibSQLDatabase, '_converters'):
+            self._col_names_lower = None
+            return None
+
+        # Lower-case each column name exactly once per result set.
+        self._col_names_lower = col_names = tuple(
+            (col_desc[0] if isinstance(col_desc, tuple) else str(col_desc)).lower()
+            for col_desc in description
+        )
+        converters = LibSQLDatabase._converters
+        col_converters = []
+        for col_name in col_names:
+            chosen = None
+            # Check for type hints in column name (e.g., "created [timestamp]")
+            for typename, converter in converters.items():
+                if f"[{typename}]" in col_name or typename in col_name:
+                    chosen = converter
+                    break
+            col_converters.append(chosen)
+        # No converter applies to any column: signal that rows can be
+        # passed through untouched.
+        if not any(col_converters):
+            return None
+        return col_converters
+
     def _convert_row(self, row):
         """Apply registered converters to row data."""
-        if not hasattr(LibSQLDatabase, '_converters') or not self.description:
+        col_converters = self._col_converters
+        if col_converters is None:
             return row
-        
-        converters = LibSQLDatabase._converters
+
         converted = []
-        
-        for i, (col_desc, value) in enumerate(zip(self.description, row)):
-            if value is not None and col_desc:
-                col_name = col_desc[0] if isinstance(col_desc, tuple) else str(col_desc)
-                # Check for type hints in column name (e.g., "created [timestamp]")
-                for typename, converter in converters.items():
-                    if f"[{typename}]" in col_name.lower() or typename in col_name.lower():
-                        try:
-                            value = converter(value)
-                        except:
-                            pass
-                        break
+        for converter, value in zip(col_converters, row):
+            if converter is not None and value is not None:
+                try:
+                    value = converter(value)
+                except:
+                    pass
             converted.append(value)
-        
         return tuple(converted)
 
 
@@ -491,7 +736,7 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         
         # Initialize connection to None (will be created lazily)
         self.connection = None
-        
+
         # Try to call parent init, but don't fail if it doesn't work
         try:
             super().__init__(settings_dict, alias)
@@ -636,6 +881,18 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         if "encryption_key" in options:
             kwargs["encryption_key"] = options["encryption_key"]
         
+        # Per-connection statement-info cache size (0 disables)
+        if "statement_cache_size" in options:
+            kwargs["statement_cache_size"] = options["statement_cache_size"]
+
+        # Opt-in lazy row decoding
+        if options.get("lazy_decode"):
+            kwargs["lazy_decode"] = True
+
+        # Opt-in multi-row INSERT rewriting
+        if options.get("bulk_insert"):
+            kwargs["bulk_insert"] = True
+
         # Transaction isolation level
         if "isolation_level" in options:
             kwargs["isolation_level"] = options["isolation_level"]
@@ -666,21 +923,72 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         kwargs["detect_types"] = Database.PARSE_DECLTYPES | Database.PARSE_COLNAMES
         kwargs["check_same_thread"] = False
         kwargs["uri"] = True
-        
         return kwargs
     
     def get_database_version(self):
         """Get database version info."""
         return Database.sqlite_version_info
     
+    # Pragmas applied to local file databases unless overridden via
+    # OPTIONS["pragmas"]. WAL + synchronous=NORMAL trade the rollback
+    # journal's fsync-per-commit for far better write throughput and
+    # concurrent readers.
+    default_pragmas = {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        "mmap_size": 268435456,
+        "cache_size": -65536,
+    }
+
+    def _pool_settings(self):
+        """Return (pool_size, max_age) for remote connection pooling."""
+        options = self.settings_dict.get("OPTIONS", {})
+        return options.get("pool_size", 0), options.get("pool_max_age", 600)
+
     @async_unsafe
     def get_new_connection(self, conn_params):
         """Create a new database connection."""
+        # For remote databases, reuse a pooled connection when possible to
+        # amortize the TLS handshake and auth round-trips.
+        pool_size, max_age = self._pool_settings()
+        pool_key = None
+        if pool_size and conn_params.get("database", "").startswith(_REMOTE_URL_PREFIXES):
+            pool_key = tuple(sorted(conn_params.items()))
+            pool = _CONNECTION_POOLS.setdefault(pool_key, queue.Queue(maxsize=pool_size))
+            while True:
+                try:
+                    conn, pooled_at = pool.get_nowait()
+                except queue.Empty:
+                    break
+                if time.monotonic() - pooled_at <= max_age:
+                    return conn
+                # Stale pooled connection; discard and keep looking.
+                try:
+                    conn.close()
+                except:
+                    pass
+
         conn = Database.connect(**conn_params)
-        
+        conn._pool_key = pool_key
+
         # Enable foreign keys
         conn.execute("PRAGMA foreign_keys = ON")
-        
+
+        # Tune local file databases. Remote/Turso and in-memory databases
+        # are left alone: the pragmas are either meaningless or managed
+        # server-side there.
+        database = conn_params.get("database", "")
+        is_local_file = (
+            database != ":memory:"
+            and not database.startswith(_REMOTE_URL_PREFIXES)
+        )
+        pragmas = self.settings_dict.get("OPTIONS", {}).get("pragmas")
+        if pragmas is None:
+            pragmas = self.default_pragmas if is_local_file else {}
+        for name, value in pragmas.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+
         # Sync if this is an embedded replica
         if hasattr(conn._connection, 'sync') and conn_params.get('sync_url'):
             try:
@@ -705,6 +1013,30 @@ class DatabaseWrapper(BaseDatabaseWrapper):
     def close(self):
         """Close the database connection."""
         self.validate_thread_sharing()
+        # Return pooled remote connections to their pool instead of closing.
+        conn = self.connection
+        pool_key = getattr(conn, '_pool_key', None)
+        if pool_key is not None:
+            pool = _CONNECTION_POOLS.get(pool_key)
+            if pool is not None:
+                # Reset transaction state before check-in so the next checkout
+                # doesn't inherit an open transaction, its locks, or a stale
+                # read snapshot. If the rollback fails the connection is
+                # broken; fall through and really close it.
+                try:
+                    if conn._connection.in_transaction:
+                        conn._connection.rollback()
+                    conn._in_transaction = False
+                except:
+                    pool = None
+            if pool is not None:
+                try:
+                    pool.put_nowait((conn, time.monotonic()))
+                except queue.Full:
+                    pass
+                else:
+                    self.connection = None
+                    return
         # If database is in memory, closing the connection destroys the
         # database. To prevent accidental data loss, ignore close requests on
         # an in-memory db.
@@ -827,16 +1159,101 @@ class DatabaseWrapper(BaseDatabaseWrapper):
         Staying in autocommit mode works around a bug of sqlite3 that breaks
         savepoints when autocommit is disabled.
         """
-        # Trust libsql to handle transactions - only start if not already in one
-        if not self.connection._connection.in_transaction:
-            self.cursor().execute("BEGIN")
+        # Trust libsql to handle transactions - only start if not already in
+        # one. Issue the BEGIN straight on the driver connection: building a
+        # LibSQLCursor for a single statement is wasted allocation on
+        # atomic()-heavy workloads.
+        connection = self.connection._connection
+        if not connection.in_transaction:
+            connection.execute("BEGIN")
     
     def is_in_memory_db(self):
         """Check if this is an in-memory database."""
         return self.creation.is_in_memory_db(self.settings_dict["NAME"])
 
 
-FORMAT_QMARK_REGEX = _lazy_re_compile(r"(?<!%)%s")
+FORMAT_QMARK_REGEX = re.compile(r"(?<!%)%s")
+_QMARK_SUB = FORMAT_QMARK_REGEX.sub
+
+PYFORMAT_NAMED_REGEX = re.compile(r"%\((\w+)\)s")
+_PYFORMAT_SUB = PYFORMAT_NAMED_REGEX.sub
+
+# Opaque handle returned by SQLiteCursorWrapper.prepare(): SQL that has
+# already been through convert_query, accepted by execute/executemany.
+_PreparedQuery = namedtuple("_PreparedQuery", ["sql"])
+
+
+def _named_placeholder(match):
+    return ":" + match.group(1)
+
+
+# Django compiles a bounded set of SQL shapes per process and replays them
+# constantly, so memoizing the placeholder conversion removes the regex work
+# from the hot path entirely. These are module-level functions (not methods)
+# so the caches aren't keyed on cursor instances.
+
+def _convert_format_py(query):
+    """
+    Convert "format" style placeholders to "qmark" style.
+
+    Single fused pass over the query, equivalent to
+    FORMAT_QMARK_REGEX.sub("?", query).replace("%%", "%") but without
+    walking the string twice: "%s" (not preceded by "%") becomes "?",
+    "%%" becomes "%", everything else is copied through.
+    """
+    if len(query) > 1024:
+        # Long statements (mostly migration DDL) are better served by two
+        # C-level passes than by a Python-level loop over every "%"; short
+        # queries stay on the fused path and are cached anyway.
+        return _QMARK_SUB("?", query).replace("%%", "%")
+    out = []
+    append = out.append
+    n = len(query)
+    start = i = 0
+    while True:
+        i = query.find("%", i)
+        if i == -1 or i == n - 1:
+            break
+        nxt = query[i + 1]
+        if nxt == "%":
+            # "%%" escape: keep one "%" and skip the pair
+            append(query[start:i + 1])
+            start = i = i + 2
+        elif nxt == "s" and (i == 0 or query[i - 1] != "%"):
+            append(query[start:i])
+            append("?")
+            start = i = i + 2
+        else:
+            i += 1
+    append(query[start:])
+    return "".join(out)
+
+
+try:
+    # Optional C accelerator (built when a compiler is available); does the
+    # same single pass without interpreter dispatch per character.
+    from django_libsql._convert import convert_format as _convert_format_impl
+except ImportError:
+    _convert_format_impl = _convert_format_py
+
+
+@functools.lru_cache(maxsize=2048)
+def _convert_format(query):
+    """Convert "format" style placeholders to "qmark" style (cached)."""
+    # Interning makes downstream SQL-keyed caches (the statement-info LRU
+    # here, libsql's own statement cache) hash and compare by pointer.
+    return sys.intern(_convert_format_impl(query))
+
+
+@functools.lru_cache(maxsize=2048)
+def _convert_pyformat(query):
+    """Convert "pyformat" style placeholders to "named" style."""
+    converted = _PYFORMAT_SUB(_named_placeholder, query)
+    # str.replace always allocates a copy; skip it unless an escaped "%%"
+    # is actually present (it rarely is in generated SQL).
+    if "%%" in converted:
+        converted = converted.replace("%%", "%")
+    return sys.intern(converted)
 
 
 class SQLiteCursorWrapper:
@@ -850,58 +1267,108 @@ class SQLiteCursorWrapper:
     
     In both cases, if you want to use a literal "%s", you'll need to use "%%s".
     """
-    
+
+    # Django creates a fresh wrapper per execute; slots drop the per-instance
+    # __dict__ and speed up the self.cursor dereference in every method. The
+    # fetch/close slots hold bound methods of the wrapped cursor, assigned in
+    # __init__ so calls forward without an intermediate Python frame. Note
+    # that without a __dict__ the wrapper no longer tolerates ad-hoc
+    # attribute assignment; set attributes on the underlying cursor instead.
+    __slots__ = ("connection", "cursor", "fetchone", "fetchmany", "fetchall", "close")
+
     def __init__(self, connection, cursor):
         """Initialize the cursor wrapper."""
         self.connection = connection
         self.cursor = cursor
+        self.fetchone = cursor.fetchone
+        self.fetchmany = cursor.fetchmany
+        self.fetchall = cursor.fetchall
+        self.close = cursor.close
     
+    def prepare(self, query, param_names=None):
+        """
+        Convert a query once and return an opaque handle that execute() and
+        executemany() accept without re-running the conversion. Useful for
+        callers that replay the same statement in their own loops.
+        """
+        return _PreparedQuery(self.convert_query(query, param_names=param_names))
+
     def execute(self, query, params=None):
         """Execute a SQL query with parameter conversion."""
+        if type(query) is _PreparedQuery:
+            if params is None:
+                return self.cursor.execute(query.sql)
+            return self.cursor.execute(query.sql, params)
         if params is None:
             return self.cursor.execute(query)
-        # Extract names if params is a mapping, i.e. "pyformat" style is used.
-        param_names = list(params) if isinstance(params, Mapping) else None
+        # Pass the mapping itself when "pyformat" style is used: the cached
+        # regex rewrite discovers the names in the query, so materializing a
+        # name list per call would be wasted work. The exact dict check runs
+        # first - it's a pointer comparison, while the Mapping isinstance
+        # goes through the ABC registry.
+        param_names = params if type(params) is dict or isinstance(params, Mapping) else None
         query = self.convert_query(query, param_names=param_names)
         return self.cursor.execute(query, params)
     
     def executemany(self, query, param_list):
         """Execute a SQL query with multiple parameter sets."""
+        if not isinstance(param_list, (list, tuple)):
+            # A generator can be passed instead of a list/tuple. Materialize
+            # it once: the driver iterates the whole thing anyway (and won't
+            # accept a bare generator), and a single list is cheaper than
+            # carrying tee()'s twin deques.
+            param_list = list(param_list)
+        if type(query) is _PreparedQuery:
+            return self.cursor.executemany(query.sql, param_list)
         # Extract names if params is a mapping, i.e. "pyformat" style is used.
-        # Peek carefully as a generator can be passed instead of a list/tuple.
-        peekable, param_list = tee(iter(param_list))
-        if (params := next(peekable, None)) and isinstance(params, Mapping):
-            param_names = list(params)
-        else:
-            param_names = None
+        params = param_list[0] if param_list else None
+        param_names = params if params and (type(params) is dict or isinstance(params, Mapping)) else None
         query = self.convert_query(query, param_names=param_names)
         return self.cursor.executemany(query, param_list)
     
     def convert_query(self, query, *, param_names=None):
-        """Convert query parameter style from Django to SQLite."""
+        """
+        Convert query parameter style from Django to SQLite.
+
+        `param_names` only signals "pyformat" style; the names themselves are
+        read from the query by the conversion regex.
+        """
         if param_names is None:
+            # No "%" means no "%s" to convert and no "%%" to unescape; skip
+            # the cache lookup and regex machinery outright. PRAGMA, BEGIN,
+            # SAVEPOINT and most DDL statements take this path.
+            if "%" not in query:
+                return query
             # Convert from "format" style to "qmark" style.
-            return FORMAT_QMARK_REGEX.sub("?", query).replace("%%", "%")
+            return _convert_format(query)
         else:
             # Convert from "pyformat" style to "named" style.
-            return query % {name: f":{name}" for name in param_names}
-    
-    def fetchone(self):
-        """Fetch one row from the result set."""
-        return self.cursor.fetchone()
-    
-    def fetchmany(self, size=None):
-        """Fetch multiple rows from the result set."""
-        return self.cursor.fetchmany(size)
-    
-    def fetchall(self):
-        """Fetch all remaining rows from the result set."""
-        return self.cursor.fetchall()
-    
-    def close(self):
-        """Close the cursor."""
-        return self.cursor.close()
+            return _convert_pyformat(query)
     
+    # Django reads these after every query; forward them through property
+    # descriptors so the common lookups skip the __getattr__ miss machinery.
+
+    @property
+    def description(self):
+        return self.cursor.description
+
+    @property
+    def rowcount(self):
+        return self.cursor.rowcount
+
+    @property
+    def lastrowid(self):
+        return self.cursor.lastrowid
+
+    # DB-API 2.0 makes arraysize read/write, so forward assignments too.
+    @property
+    def arraysize(self):
+        return self.cursor.arraysize
+
+    @arraysize.setter
+    def arraysize(self, value):
+        self.cursor.arraysize = value
+
     def __getattr__(self, name):
         """Proxy all other attributes to the underlying cursor."""
         return getattr(self.cursor, name)